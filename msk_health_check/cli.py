@@ -4,7 +4,7 @@ import argparse
 import sys
 import logging
 import os
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
 
@@ -111,7 +111,6 @@ def main() -> int:
         # Calculate available days based on cluster age
         days_back = 30  # Default
         if cluster_info.creation_time:
-            from datetime import datetime, timezone
             now = datetime.now(timezone.utc)
             cluster_age_days = (now - cluster_info.creation_time).days
             if cluster_age_days < 30:
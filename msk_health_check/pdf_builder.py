@@ -1,22 +1,127 @@
 """PDF report builder module."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from io import BytesIO
 from typing import Dict, List
 
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image, Table, TableStyle, PageBreak, KeepTogether
-from reportlab.lib.enums import TA_CENTER, TA_LEFT
-
 from .analyzer import AnalysisResult, Finding, Severity
 from .cluster_info import ClusterInfo
 from .metrics_collector import MetricData
 from .recommendations import Recommendation
 
+# Font colors by finding severity, built once at import instead of a fresh
+# dict per finding section.
+_SEVERITY_COLOR = {
+    Severity.CRITICAL: '#d32f2f',
+    Severity.WARNING: '#f57c00',
+    Severity.INFORMATIONAL: '#1976d2',
+    Severity.HEALTHY: '#388e3c',
+}
+
+# Row background colors by recommendation priority, allocated once (on first
+# PDF build) instead of one HexColor per table row.
+_PRIORITY_BG = {}
+
+# Color instances keyed by hex string, allocated once on first PDF build;
+# HexColor() reparses the hex string on every call, so table styles look
+# these up instead of constructing new colors per row.
+_COLOR_CACHE = {}
+
+_REPORTLAB_LOADED = False
+
+# Escape table for text spliced into Paragraph markup; str.translate scans
+# the string once in C instead of chained .replace() passes.
+_HTML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'})
+
+# Markup fragments for recommendation paragraphs; a single join over these
+# literals avoids re-running an f-string template per recommendation.
+_B_ACTION = '<b>Action:</b> '
+_B_IMPACT_OPEN = '<br/><b>Impact if not addressed:</b> <i>'
+_B_RATIONALE_OPEN = '<br/><b>Rationale:</b> <i>'
+_I_CLOSE = '</i>'
+
+# Static report text, assembled once at import. Building these as single-line
+# constants (rather than indented triple-quoted f-strings inside the section
+# builders) hands the XML parser pre-normalized text with no stray whitespace.
+_EXEC_OVERVIEW_TEMPLATE = (
+    'This operational review analyzes the health and performance of the Amazon MSK cluster '
+    '<b>{name}</b> {period_text}. The cluster is running Kafka version '
+    '{kafka_version} with {broker_count} broker nodes on {instance_type} instances.'
+)
+
+_EXEC_SCOPE_TEMPLATE = (
+    'This review analyzed {metric_count} metric types collected over {metrics_days} days, '
+    'covering reliability, performance, capacity, and configuration best practices. '
+    'The analysis includes automated checks against AWS MSK best practices and industry standards.'
+)
+
+_OVERVIEW_TEXT = (
+    'Amazon MSK Operational Review is a proactive, targeted operational review based on your MSK cluster '
+    'against design and configuration best practices. This review provides prescriptive and actionable '
+    'recommendations for optimizing the MSK cluster configurations for reliability, security, performance '
+    'and cost optimization.'
+)
+
+_DISCLAIMER_TEXT = (
+    'This health check report provides automated analysis based on general AWS best practices '
+    'and standard metric thresholds. The findings and recommendations are synthetic in nature '
+    'and should be interpreted within the context of your specific environment.'
+)
+
+
+def _load_reportlab() -> None:
+    """
+    Import ReportLab on first PDF build instead of at module import.
+    ReportLab pulls in a large dependency graph; deferring the import keeps
+    CLI startup fast for invocations that never render a PDF (e.g. --help
+    or validation failures).
+    """
+    global _REPORTLAB_LOADED, _BASE_STYLES
+    global colors, letter, getSampleStyleSheet, ParagraphStyle, inch
+    global SimpleDocTemplate, Paragraph, Spacer, Image, Table, TableStyle, PageBreak, KeepTogether
+    global TA_CENTER, TA_LEFT, ParaFrag
+
+    if _REPORTLAB_LOADED:
+        return
+
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image, Table, TableStyle, PageBreak, KeepTogether
+    from reportlab.lib.enums import TA_CENTER, TA_LEFT
+    from reportlab.platypus.paraparser import ParaFrag
+
+    _COLOR_CACHE.update({
+        h: colors.HexColor(h) for h in (
+            '#0066cc',  # primary blue
+            '#6c757d',  # secondary gray
+            '#28a745',  # success green
+            '#f8d7da',  # critical red background
+            '#fff3cd',  # warning yellow background
+            '#d1ecf1',  # informational blue background
+            '#d4edda',  # healthy green background
+            '#e9ecef',  # neutral gray background
+            '#495057',  # dark gray text
+            '#dee2e6',  # grid lines
+        )
+    })
+
+    _PRIORITY_BG.update({
+        1: _COLOR_CACHE['#f8d7da'],  # CRITICAL
+        2: _COLOR_CACHE['#fff3cd'],  # HIGH
+        3: _COLOR_CACHE['#d1ecf1'],  # MEDIUM
+    })
+
+    # Sample stylesheet built once; section builders only read from it and
+    # derive child ParagraphStyles, so one shared instance is safe.
+    _BASE_STYLES = getSampleStyleSheet()
+
+    _REPORTLAB_LOADED = True
+
 
 @dataclass
 class ReportContent:
@@ -36,6 +141,8 @@ def build_pdf_report(content: ReportContent, output_path: str) -> None:
         content: Report content to include
         output_path: Path to save PDF file
     """
+    _load_reportlab()
+
     doc = SimpleDocTemplate(
         output_path, 
         pagesize=letter,
@@ -45,12 +152,12 @@ def build_pdf_report(content: ReportContent, output_path: str) -> None:
         bottomMargin=0.75*inch
     )
     story = []
-    styles = getSampleStyleSheet()
+    styles = _BASE_STYLES
     
     # Define consistent color scheme (Rule of 3)
-    PRIMARY_COLOR = colors.HexColor('#0066cc')    # Professional blue
-    SECONDARY_COLOR = colors.HexColor('#6c757d')  # Neutral gray
-    ACCENT_COLOR = colors.HexColor('#28a745')     # Success green
+    PRIMARY_COLOR = _COLOR_CACHE['#0066cc']    # Professional blue
+    SECONDARY_COLOR = _COLOR_CACHE['#6c757d']  # Neutral gray
+    ACCENT_COLOR = _COLOR_CACHE['#28a745']     # Success green
     
     # Custom styles with better hierarchy
     title_style = ParagraphStyle(
@@ -103,20 +210,43 @@ def build_pdf_report(content: ReportContent, output_path: str) -> None:
     story.append(Spacer(1, 0.3*inch))
     
     charts_dict = {chart.metric_name: chart.image_data for chart in content.charts}
-    
+    # Frozen key view for the membership tests below; makes the intent
+    # (which metrics got a chart) explicit without carrying the image payloads.
+    charted_metrics = frozenset(charts_dict)
+
     # Show all metrics that have charts
-    for metric_name, chart_data in charts_dict.items():
+    def build_section(metric_name, chart_data):
         metric_list = content.analysis.metrics.metrics.get(metric_name, [])
         findings = [f for f in content.analysis.findings if f.metric_name == metric_name]
         recs = [r for r in content.recommendations if r.finding in findings]
-        
-        # Use first metric (cluster-level or first broker) for display
-        metric = metric_list[0] if metric_list and isinstance(metric_list, list) else (metric_list if metric_list else None)
-        story.extend(create_metric_section(metric_name, metric, metric_list, findings, recs, chart_data))
+
+        # Use first metric (cluster-level or first broker) for display.
+        # metrics_collector guarantees metric_list is always a list (possibly empty).
+        metric = metric_list[0] if metric_list else None
+        return create_metric_section(metric_name, metric, metric_list, findings, recs, chart_data)
+
+    # Sections are independent (each builds its own flowables, nothing mutable
+    # is shared across threads), so build them in parallel when there are
+    # enough to amortize the thread-pool overhead. Results keep chart order.
+    if len(charts_dict) >= 4:
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = [
+                executor.submit(build_section, metric_name, chart_data)
+                for metric_name, chart_data in charts_dict.items()
+            ]
+            sections = [future.result() for future in futures]
+    else:
+        sections = [
+            build_section(metric_name, chart_data)
+            for metric_name, chart_data in charts_dict.items()
+        ]
+
+    for section in sections:
+        story.extend(section)
         story.append(PageBreak())
     
     # Configuration findings (no metrics/charts)
-    config_findings = [f for f in content.analysis.findings if f.metric_name not in charts_dict]
+    config_findings = [f for f in content.analysis.findings if f.metric_name not in charted_metrics]
     if config_findings:
         story.append(Paragraph('<b>Configuration Analysis</b>', styles['Heading1']))
         story.append(Spacer(1, 0.2*inch))
@@ -140,6 +270,40 @@ def build_pdf_report(content: ReportContent, output_path: str) -> None:
     doc.build(story)
 
 
+def _recommendation_paragraph(rec: Recommendation, style) -> 'Paragraph':
+    """Build the Action/Impact/Rationale paragraph for a recommendation."""
+    parts = [_B_ACTION, rec.action]
+    if rec.impact:
+        parts += (_B_IMPACT_OPEN, rec.impact, _I_CLOSE)
+    if rec.rationale:
+        parts += (_B_RATIONALE_OPEN, rec.rationale, _I_CLOSE)
+    return Paragraph(''.join(parts), style)
+
+
+def _plain_paragraph(text: str, style) -> 'Paragraph':
+    """
+    Create a Paragraph from plain text, bypassing the inline-XML parser.
+
+    Paragraph() XML-parses its text to find <b>/<font> markup. Finding and
+    recommendation bullets contain no markup, so handing ReportLab a
+    pre-built frag skips the per-paragraph parse entirely.
+    """
+    frag = ParaFrag(
+        __tag__='para',
+        rise=0,
+        greek=0,
+        link=[],
+        us_lines=[],
+        bold=0,
+        italic=0,
+        fontName=style.fontName,
+        fontSize=style.fontSize,
+        textColor=style.textColor,
+        text=text
+    )
+    return Paragraph(text, style, frags=[frag])
+
+
 def create_table_of_contents(styles) -> List:
     """Create table of contents."""
     elements = []
@@ -189,11 +353,14 @@ def create_executive_summary(content: ReportContent, styles) -> List:
     else:
         period_text = "over a 30-day period"
     
-    overview = f"""This operational review analyzes the health and performance of the Amazon MSK cluster 
-    <b>{content.cluster_info.name}</b> {period_text}. The cluster is running Kafka version 
-    {content.cluster_info.kafka_version} with {content.cluster_info.broker_count} broker nodes 
-    on {content.cluster_info.instance_type} instances."""
-    
+    overview = _EXEC_OVERVIEW_TEMPLATE.format(
+        name=content.cluster_info.name,
+        period_text=period_text,
+        kafka_version=content.cluster_info.kafka_version,
+        broker_count=content.cluster_info.broker_count,
+        instance_type=content.cluster_info.instance_type
+    )
+
     elements.append(Paragraph(overview, styles['Normal']))
     elements.append(Spacer(1, 0.2*inch))
     
@@ -228,7 +395,7 @@ def create_executive_summary(content: ReportContent, styles) -> List:
         
         top_recs = sorted(content.recommendations, key=lambda r: r.priority)[:3]
         for i, rec in enumerate(top_recs, 1):
-            elements.append(Paragraph(f'{i}. {rec.action}', styles['Normal']))
+            elements.append(_plain_paragraph(f'{i}. {rec.action}', styles['Normal']))
             elements.append(Spacer(1, 0.05*inch))
     
     elements.append(Spacer(1, 0.2*inch))
@@ -237,10 +404,11 @@ def create_executive_summary(content: ReportContent, styles) -> List:
     elements.append(Paragraph('<b>Analysis Scope:</b>', styles['Heading3']))
     elements.append(Spacer(1, 0.1*inch))
     
-    scope_text = f"""This review analyzed {len(content.analysis.metrics.metrics)} metric types collected over {metrics_days} days, 
-    covering reliability, performance, capacity, and configuration best practices. The analysis includes automated 
-    checks against AWS MSK best practices and industry standards."""
-    
+    scope_text = _EXEC_SCOPE_TEMPLATE.format(
+        metric_count=len(content.analysis.metrics.metrics),
+        metrics_days=metrics_days
+    )
+
     elements.append(Paragraph(scope_text, styles['Normal']))
     
     return elements
@@ -252,11 +420,7 @@ def create_overview_section(styles) -> List:
     
     elements.append(Paragraph('<b>Overview</b>', styles['Heading2']))
     
-    overview_text = """Amazon MSK Operational Review is a proactive, targeted operational review based on your MSK cluster 
-    against design and configuration best practices. This review provides prescriptive and actionable recommendations 
-    for optimizing the MSK cluster configurations for reliability, security, performance and cost optimization."""
-    
-    elements.append(Paragraph(overview_text, styles['Normal']))
+    elements.append(Paragraph(_OVERVIEW_TEXT, styles['Normal']))
     elements.append(Spacer(1, 0.2*inch))
     
     # Analysis categories
@@ -320,7 +484,7 @@ def create_summary_section(content: ReportContent) -> List:
         List of reportlab flowables
     """
     elements = []
-    styles = getSampleStyleSheet()
+    styles = _BASE_STYLES
     
     # Extract Account ID and Region from ARN
     arn_parts = content.cluster_info.arn.split(':')
@@ -359,9 +523,9 @@ def create_summary_section(content: ReportContent) -> List:
         ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
         ('TOPPADDING', (0, 0), (-1, -1), 10),
         ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#e9ecef')),
-        ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#495057')),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#dee2e6')),
+        ('BACKGROUND', (0, 0), (0, -1), _COLOR_CACHE['#e9ecef']),
+        ('TEXTCOLOR', (0, 0), (0, -1), _COLOR_CACHE['#495057']),
+        ('GRID', (0, 0), (-1, -1), 1, _COLOR_CACHE['#dee2e6']),
     ]))
     cluster_details.append(info_table)
     
@@ -389,7 +553,7 @@ def create_summary_section(content: ReportContent) -> List:
     
     summary_table = Table(summary_data, colWidths=[2*inch, 1.5*inch, 1*inch])
     summary_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#0066cc')),
+        ('BACKGROUND', (0, 0), (-1, 0), _COLOR_CACHE['#0066cc']),
         ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
         ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
         ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
@@ -398,12 +562,12 @@ def create_summary_section(content: ReportContent) -> List:
         ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
         ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
         ('TOPPADDING', (0, 0), (-1, -1), 10),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#dee2e6')),
-        ('BACKGROUND', (0, 1), (-1, 1), colors.HexColor('#f8d7da') if len(critical_findings) > 0 else colors.HexColor('#d4edda')),
-        ('BACKGROUND', (0, 2), (-1, 2), colors.HexColor('#fff3cd') if len(warning_findings) > 0 else colors.HexColor('#d4edda')),
-        ('BACKGROUND', (0, 3), (-1, 3), colors.HexColor('#d1ecf1')),
-        ('BACKGROUND', (0, 4), (-1, 4), colors.HexColor('#d4edda')),
-        ('BACKGROUND', (0, 5), (-1, 5), colors.HexColor('#e9ecef')),
+        ('GRID', (0, 0), (-1, -1), 1, _COLOR_CACHE['#dee2e6']),
+        ('BACKGROUND', (0, 1), (-1, 1), _COLOR_CACHE['#f8d7da'] if len(critical_findings) > 0 else _COLOR_CACHE['#d4edda']),
+        ('BACKGROUND', (0, 2), (-1, 2), _COLOR_CACHE['#fff3cd'] if len(warning_findings) > 0 else _COLOR_CACHE['#d4edda']),
+        ('BACKGROUND', (0, 3), (-1, 3), _COLOR_CACHE['#d1ecf1']),
+        ('BACKGROUND', (0, 4), (-1, 4), _COLOR_CACHE['#d4edda']),
+        ('BACKGROUND', (0, 5), (-1, 5), _COLOR_CACHE['#e9ecef']),
         ('FONTNAME', (0, 5), (-1, 5), 'Helvetica-Bold'),
     ]))
     elements.append(summary_table)
@@ -413,28 +577,28 @@ def create_summary_section(content: ReportContent) -> List:
     if critical_findings:
         elements.append(Paragraph('<font color="#dc3545"><b>Critical Issues:</b></font>', styles['Heading3']))
         for f in critical_findings:
-            elements.append(Paragraph(f'• {f.title}', styles['Normal']))
+            elements.append(_plain_paragraph(f'• {f.title}', styles['Normal']))
         elements.append(Spacer(1, 0.1*inch))
     
     # List warnings
     if warning_findings:
         elements.append(Paragraph('<font color="#f57c00"><b>Warnings:</b></font>', styles['Heading3']))
         for f in warning_findings:
-            elements.append(Paragraph(f'• {f.title}', styles['Normal']))
+            elements.append(_plain_paragraph(f'• {f.title}', styles['Normal']))
         elements.append(Spacer(1, 0.1*inch))
     
     # List informational
     if info_findings:
         elements.append(Paragraph('<font color="#1976d2"><b>Informational:</b></font>', styles['Heading3']))
         for f in info_findings:
-            elements.append(Paragraph(f'• {f.title}', styles['Normal']))
+            elements.append(_plain_paragraph(f'• {f.title}', styles['Normal']))
         elements.append(Spacer(1, 0.1*inch))
     
     # List healthy
     if healthy_findings:
         elements.append(Paragraph('<font color="#388e3c"><b>Healthy:</b></font>', styles['Heading3']))
         for f in healthy_findings:
-            elements.append(Paragraph(f'• {f.title}', styles['Normal']))
+            elements.append(_plain_paragraph(f'• {f.title}', styles['Normal']))
         elements.append(Spacer(1, 0.1*inch))
     
     return elements
@@ -463,7 +627,7 @@ def create_metric_section(
         List of reportlab flowables
     """
     elements = []
-    styles = getSampleStyleSheet()
+    styles = _BASE_STYLES
     
     # Metric title
     elements.append(Paragraph(f'<b>{metric_name}</b>', styles['Heading2']))
@@ -474,9 +638,10 @@ def create_metric_section(
     elements.append(Spacer(1, 0.1*inch))
     
     # Statistics table - only if we have metrics
+    is_multi = len(metric_list) > 1
     if metric or metric_list:
         # Statistics table - show per-broker if multiple brokers
-        if isinstance(metric_list, list) and len(metric_list) > 1:
+        if is_multi:
             # Per-broker statistics
             stats_data = [['Broker', 'Min', 'Max', 'Avg']]
             for m in metric_list:
@@ -527,13 +692,8 @@ def create_metric_section(
     if findings:
         elements.append(Paragraph('<b>Status:</b>', styles['Heading3']))
         for finding in findings:
-            severity_color = {
-                Severity.CRITICAL: '#d32f2f',
-                Severity.WARNING: '#f57c00',
-                Severity.INFORMATIONAL: '#1976d2',
-                Severity.HEALTHY: '#388e3c'
-            }.get(finding.severity, '#000000')
-            
+            severity_color = _SEVERITY_COLOR.get(finding.severity, '#000000')
+
             elements.append(Paragraph(
                 f'<font color="{severity_color}"><b>{finding.severity.value.upper()}: {finding.title}</b></font>',
                 styles['Normal']
@@ -553,11 +713,9 @@ def create_metric_section(
     if recommendations:
         elements.append(Paragraph('<b>Recommendations:</b>', styles['Heading3']))
         for rec in recommendations:
-            elements.append(Paragraph(f'<b>Action:</b> {rec.action}', styles['Normal']))
-            if rec.impact:
-                elements.append(Paragraph(f'<b>Impact if not addressed:</b> <i>{rec.impact}</i>', styles['Normal']))
-            if rec.rationale:
-                elements.append(Paragraph(f'<b>Rationale:</b> <i>{rec.rationale}</i>', styles['Normal']))
+            # One Paragraph per recommendation instead of one per field: fewer
+            # flowables to lay out and fewer inline-XML parses
+            elements.append(_recommendation_paragraph(rec, styles['Normal']))
             elements.append(Spacer(1, 0.05*inch))
     
     elements.append(Spacer(1, 0.3*inch))
@@ -651,7 +809,7 @@ def create_recommendations_table(recommendations: List[Recommendation], styles)
     
     # Base style with consistent colors
     table_style = [
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#0066cc')),
+        ('BACKGROUND', (0, 0), (-1, 0), _COLOR_CACHE['#0066cc']),
         ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
         ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
         ('VALIGN', (0, 0), (-1, -1), 'TOP'),
@@ -659,17 +817,15 @@ def create_recommendations_table(recommendations: List[Recommendation], styles)
         ('FONTSIZE', (0, 0), (-1, -1), 8),
         ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
         ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#dee2e6')),
+        ('GRID', (0, 0), (-1, -1), 1, _COLOR_CACHE['#dee2e6']),
     ]
     
-    # Add row colors based on severity
-    for idx, rec in enumerate(sorted_recs, start=1):
-        if rec.priority == 1:  # CRITICAL
-            table_style.append(('BACKGROUND', (0, idx), (-1, idx), colors.HexColor('#f8d7da')))
-        elif rec.priority == 2:  # HIGH
-            table_style.append(('BACKGROUND', (0, idx), (-1, idx), colors.HexColor('#fff3cd')))
-        elif rec.priority == 3:  # MEDIUM
-            table_style.append(('BACKGROUND', (0, idx), (-1, idx), colors.HexColor('#d1ecf1')))
+    # Add row colors based on severity (precomputed colors, no per-row allocation)
+    table_style.extend(
+        ('BACKGROUND', (0, idx), (-1, idx), _PRIORITY_BG[rec.priority])
+        for idx, rec in enumerate(sorted_recs, start=1)
+        if rec.priority in _PRIORITY_BG
+    )
     
     rec_table.setStyle(TableStyle(table_style))
     
@@ -696,7 +852,10 @@ def create_important_links_section(styles) -> List:
     ]
     
     for title, url in links:
-        elements.append(Paragraph(f'• <a href="{url}" color="blue">{title}</a>', styles['Normal']))
+        elements.append(Paragraph(
+            f'• <a href="{url.translate(_HTML_ESCAPE)}" color="blue">{title.translate(_HTML_ESCAPE)}</a>',
+            styles['Normal']
+        ))
     
     return elements
 
@@ -708,12 +867,7 @@ def create_disclaimer_section(styles) -> List:
     elements.append(Paragraph('<b>Important Notice</b>', styles['Heading1']))
     elements.append(Spacer(1, 0.2*inch))
     
-    disclaimer_text = """
-    This health check report provides automated analysis based on general AWS best practices 
-    and standard metric thresholds. The findings and recommendations are synthetic in nature 
-    and should be interpreted within the context of your specific environment.
-    """
-    elements.append(Paragraph(disclaimer_text, styles['Normal']))
+    elements.append(Paragraph(_DISCLAIMER_TEXT, styles['Normal']))
     elements.append(Spacer(1, 0.2*inch))
     
     elements.append(Paragraph('<b>Key Considerations:</b>', styles['Heading2']))
@@ -737,13 +891,8 @@ def create_config_finding_section(finding: Finding, recommendations: List[Recomm
     """Create section for configuration finding (no metric/chart)."""
     elements = []
     
-    severity_color = {
-        Severity.CRITICAL: '#d32f2f',
-        Severity.WARNING: '#f57c00',
-        Severity.INFORMATIONAL: '#1976d2',
-        Severity.HEALTHY: '#388e3c'
-    }.get(finding.severity, '#000000')
-    
+    severity_color = _SEVERITY_COLOR.get(finding.severity, '#000000')
+
     elements.append(Paragraph(f'<b>{finding.metric_name}</b>', styles['Heading2']))
     elements.append(Paragraph(
         f'<font color="{severity_color}"><b>{finding.severity.value.upper()}: {finding.title}</b></font>',
@@ -755,11 +904,9 @@ def create_config_finding_section(finding: Finding, recommendations: List[Recomm
     if recommendations:
         elements.append(Paragraph('<b>Recommendations:</b>', styles['Heading3']))
         for rec in recommendations:
-            elements.append(Paragraph(f'<b>Action:</b> {rec.action}', styles['Normal']))
-            if rec.impact:
-                elements.append(Paragraph(f'<b>Impact if not addressed:</b> <i>{rec.impact}</i>', styles['Normal']))
-            if rec.rationale:
-                elements.append(Paragraph(f'<b>Rationale:</b> <i>{rec.rationale}</i>', styles['Normal']))
+            # One Paragraph per recommendation instead of one per field: fewer
+            # flowables to lay out and fewer inline-XML parses
+            elements.append(_recommendation_paragraph(rec, styles['Normal']))
             elements.append(Spacer(1, 0.05*inch))
     
     return elements
@@ -1,12 +1,16 @@
 """Recommendation generation module."""
 
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Dict, List, Optional
 
 from .analyzer import AnalysisResult, Finding, Severity, Category
 
+# Severities that warrant a recommendation; frozenset gives O(1) membership
+_ACTIONABLE_SEVERITIES = frozenset({Severity.CRITICAL, Severity.WARNING, Severity.INFORMATIONAL})
 
-@dataclass
+
+@dataclass(slots=True)
 class Recommendation:
     """Actionable recommendation with context."""
     finding: Finding
@@ -173,6 +177,66 @@ RECOMMENDATION_TEMPLATES = {
 }
 
 
+# Special-case templates, shared across calls instead of rebuilt per finding.
+# Fields that depend on the finding itself (the imbalance action, the generic
+# action/rationale) are computed locally and override the template values.
+_PARTITION_LOW_TEMPLATE = {
+    'action': 'Consider downsizing cluster by reducing broker count or using smaller instance types',
+    'rationale': 'Low partition utilization indicates over-provisioning, leading to unnecessary costs',
+    'impact': 'Higher operational costs than necessary',
+    'docs': ['https://docs.aws.amazon.com/msk/latest/developerguide/bestpractices.html#right-sizing'],
+    'estimated_impact': 'Reduce operational costs while maintaining adequate capacity'
+}
+
+_PARTITION_IMBALANCE_TEMPLATE = {
+    'action': 'Rebalance partitions across all brokers',
+    'rationale': 'Uneven partition distribution causes performance hotspots and inefficient resource utilization',
+    'impact': 'Performance degradation on overloaded brokers and underutilization of available capacity',
+    'docs': ['https://docs.aws.amazon.com/msk/latest/developerguide/bestpractices.html#partitions-per-broker'],
+    'estimated_impact': 'Improve cluster balance, optimize resource utilization, and enhance overall performance'
+}
+
+_PARTITION_HIGH_TEMPLATE = {
+    'action': 'Add more brokers or upgrade to larger instance type to handle partition load',
+    'rationale': 'Excessive partitions per broker degrades performance and increases latency',
+    'impact': 'Performance degradation, increased latency, and potential broker overload',
+    'docs': ['https://docs.aws.amazon.com/msk/latest/developerguide/bestpractices.html#partitions-per-broker'],
+    'estimated_impact': 'Improve throughput, reduce latency, and prevent broker overload'
+}
+
+_GENERIC_TEMPLATE = {
+    'impact': 'May affect cluster performance or reliability',
+    'docs': ['https://docs.aws.amazon.com/msk/'],
+    'estimated_impact': 'Improve cluster health'
+}
+
+# Base priority by severity (1 = highest)
+_SEVERITY_PRIORITY = {
+    Severity.CRITICAL: 1,
+    Severity.WARNING: 2,
+    Severity.INFORMATIONAL: 3,
+    Severity.HEALTHY: 5
+}
+
+# Context-sensitive priority overrides, keyed by (metric_name, severity,
+# context flag) and resolved with a single lookup. The context flag carries
+# the one per-metric condition the priority logic cares about: rebalance
+# actionability for PartitionCount, low-usage imbalance for the memory and
+# connection metrics, and False where no extra condition applies.
+_PRIORITY_OVERRIDES = {
+    # Partition imbalance with available capacity is actionable right now
+    **{('PartitionCount', severity, True): 1 for severity in Severity},
+    # High CPU usage has direct performance impact
+    ('CpuTotal', Severity.CRITICAL, False): 1,
+    # Memory/connection imbalance at low usage drops one priority level
+    **{(metric, severity, True): min(_SEVERITY_PRIORITY[severity] + 1, 4)
+       for metric in ('MemoryUsed', 'ClientConnectionCount', 'ConnectionCount')
+       for severity in Severity},
+    # Authentication warnings are important but not urgent
+    ('Authentication', Severity.WARNING, False): 2,
+}
+
+
 def generate_recommendations(analysis: AnalysisResult) -> List[Recommendation]:
     """
     Generate prioritized recommendations from analysis.
@@ -186,13 +250,13 @@ def generate_recommendations(analysis: AnalysisResult) -> List[Recommendation]:
     recommendations = []
     
     for finding in analysis.findings:
-        if finding.severity in [Severity.CRITICAL, Severity.WARNING, Severity.INFORMATIONAL]:
+        if finding.severity in _ACTIONABLE_SEVERITIES:
             rec = create_recommendation_for_finding(finding)
             if rec:
                 recommendations.append(rec)
-    
-    # Sort by priority (1 = highest)
-    recommendations.sort(key=lambda r: r.priority)
+
+    # Sort by priority (1 = highest); attrgetter dispatches in C
+    recommendations.sort(key=attrgetter('priority'))
     
     return recommendations
 
@@ -207,86 +271,62 @@ def create_recommendation_for_finding(finding: Finding) -> Optional[Recommendati
     Returns:
         Recommendation with action and context, or None if not actionable
     """
+    # Substring checks computed once per finding and reused across branches;
+    # descriptions can be long paragraphs, so avoid rescanning them
+    is_imbalance = 'Imbalance' in finding.title
+    has_rebalance_action = 'Rebalance partitions' in finding.description
+
     # Skip recommendations for low-impact imbalances
     if finding.metric_name in ['ClientConnectionCount', 'ConnectionCount', 'MemoryUsed']:
-        if 'Imbalance' in finding.title and finding.current_value < 10:
+        if is_imbalance and finding.current_value < 10:
             return None  # Too low to be actionable
-    
+
+    # Per-finding overrides of the shared template values
+    action = None
+    rationale = None
+
     # Special handling for partition count based on finding title/description
     if finding.metric_name == 'PartitionCount':
         if 'Low Partition Utilization' in finding.title:
-            template = {
-                'action': 'Consider downsizing cluster by reducing broker count or using smaller instance types',
-                'rationale': 'Low partition utilization indicates over-provisioning, leading to unnecessary costs',
-                'impact': 'Higher operational costs than necessary',
-                'docs': ['https://docs.aws.amazon.com/msk/latest/developerguide/bestpractices.html#right-sizing'],
-                'estimated_impact': 'Reduce operational costs while maintaining adequate capacity'
-            }
-        elif 'Imbalance' in finding.title and 'Rebalance partitions' in finding.description:
-            # Extract the rebalancing recommendation from the description
-            template = {
-                'action': finding.description.split('. ')[2] if len(finding.description.split('. ')) > 2 else 'Rebalance partitions across all brokers',
-                'rationale': 'Uneven partition distribution causes performance hotspots and inefficient resource utilization',
-                'impact': 'Performance degradation on overloaded brokers and underutilization of available capacity',
-                'docs': ['https://docs.aws.amazon.com/msk/latest/developerguide/bestpractices.html#partitions-per-broker'],
-                'estimated_impact': 'Improve cluster balance, optimize resource utilization, and enhance overall performance'
-            }
+            template = _PARTITION_LOW_TEMPLATE
+        elif is_imbalance and has_rebalance_action:
+            # Extract the rebalancing recommendation from the description.
+            # Split once with maxsplit so the scan stops after the sentence we need.
+            template = _PARTITION_IMBALANCE_TEMPLATE
+            parts = finding.description.split('. ', 3)
+            if len(parts) > 2:
+                action = parts[2]
         else:  # High/Excessive partition count
-            template = {
-                'action': 'Add more brokers or upgrade to larger instance type to handle partition load',
-                'rationale': 'Excessive partitions per broker degrades performance and increases latency',
-                'impact': 'Performance degradation, increased latency, and potential broker overload',
-                'docs': ['https://docs.aws.amazon.com/msk/latest/developerguide/bestpractices.html#partitions-per-broker'],
-                'estimated_impact': 'Improve throughput, reduce latency, and prevent broker overload'
-            }
+            template = _PARTITION_HIGH_TEMPLATE
     else:
         template = RECOMMENDATION_TEMPLATES.get(finding.metric_name)
-    
+
     if not template:
         # Generic recommendation
-        template = {
-            'action': f'Review and address {finding.title}',
-            'rationale': finding.description,
-            'impact': 'May affect cluster performance or reliability',
-            'docs': ['https://docs.aws.amazon.com/msk/'],
-            'estimated_impact': 'Improve cluster health'
-        }
-    
-    # Determine priority based on severity and context
-    priority_map = {
-        Severity.CRITICAL: 1,
-        Severity.WARNING: 2,
-        Severity.INFORMATIONAL: 3,
-        Severity.HEALTHY: 5
-    }
-    
-    base_priority = priority_map.get(finding.severity, 3)
-    
-    # Adjust priority based on context
-    # Partition imbalance with available capacity is high priority
-    if finding.metric_name == 'PartitionCount' and 'Imbalance' in finding.title:
-        if 'Rebalance partitions' in finding.description:
-            base_priority = 1  # Highest priority - actionable with available capacity
-    
-    # High CPU usage is critical priority
-    if finding.metric_name == 'CpuTotal' and finding.severity == Severity.CRITICAL:
-        base_priority = 1  # Highest priority - performance impact
-    
-    # Memory/Connection imbalance with low usage is lower priority
-    if finding.metric_name in ['MemoryUsed', 'ClientConnectionCount', 'ConnectionCount']:
-        if 'Imbalance' in finding.title and finding.current_value < 50:
-            base_priority = min(base_priority + 1, 4)  # Lower priority if usage is low
-    
-    # Authentication warnings are important but not urgent if cluster is stable
-    if finding.metric_name == 'Authentication' and finding.severity == Severity.WARNING:
-        base_priority = 2  # Important but not critical
+        template = _GENERIC_TEMPLATE
+        action = f'Review and address {finding.title}'
+        rationale = finding.description
     
+    # Determine priority: base from severity, then one table lookup for the
+    # context-sensitive overrides instead of a branch cascade per finding
+    if finding.metric_name == 'PartitionCount':
+        context = is_imbalance and has_rebalance_action
+    elif finding.metric_name in ('MemoryUsed', 'ClientConnectionCount', 'ConnectionCount'):
+        context = is_imbalance and finding.current_value < 50
+    else:
+        context = False
+
+    base_priority = _SEVERITY_PRIORITY.get(finding.severity, 3)
+    priority = _PRIORITY_OVERRIDES.get(
+        (finding.metric_name, finding.severity, context), base_priority
+    )
+
     return Recommendation(
         finding=finding,
-        action=template['action'],
-        rationale=template['rationale'],
+        action=action if action is not None else template['action'],
+        rationale=rationale if rationale is not None else template['rationale'],
         impact=template.get('impact', 'May affect cluster performance or reliability'),
         documentation_links=template['docs'],
-        priority=base_priority,
+        priority=priority,
         estimated_impact=template['estimated_impact']
     )
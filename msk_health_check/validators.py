@@ -6,8 +6,13 @@ from typing import Optional
 
 from botocore.exceptions import ClientError
 
+# Validation patterns, compiled once at import instead of per call
+_REGION_RE = re.compile(r'^[a-z]{2}-[a-z]+-\d{1}$')
+# Support both Standard and Express (with -s suffix) cluster ARNs
+_ARN_RE = re.compile(r'^arn:aws:kafka:[a-z]{2}-[a-z]+-\d{1}:\d{12}:cluster/[a-zA-Z0-9_-]+/[a-f0-9-]+(-s\d+)?$')
 
-@dataclass
+
+@dataclass(slots=True)
 class ValidationResult:
     """Result of a validation operation."""
     is_valid: bool
@@ -24,8 +29,7 @@ def validate_region(region: str) -> ValidationResult:
     Returns:
         ValidationResult indicating if region is valid
     """
-    pattern = r'^[a-z]{2}-[a-z]+-\d{1}$'
-    if re.match(pattern, region):
+    if _REGION_RE.match(region):
         return ValidationResult(is_valid=True)
     return ValidationResult(
         is_valid=False,
@@ -43,9 +47,7 @@ def validate_arn(arn: str) -> ValidationResult:
     Returns:
         ValidationResult indicating if ARN is valid
     """
-    # Support both Standard and Express (with -s suffix) cluster ARNs
-    pattern = r'^arn:aws:kafka:[a-z]{2}-[a-z]+-\d{1}:\d{12}:cluster/[a-zA-Z0-9_-]+/[a-f0-9-]+(-s\d+)?$'
-    if re.match(pattern, arn):
+    if _ARN_RE.match(arn):
         return ValidationResult(is_valid=True)
     return ValidationResult(
         is_valid=False,
@@ -0,0 +1,171 @@
+"""Shared pytest fixtures."""
+
+import functools
+import os
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from hypothesis import Phase, settings
+from unittest.mock import MagicMock
+
+# cluster_info is import-light; metrics_collector pulls in botocore and
+# numpy, so it is imported lazily inside the fixtures that need it to
+# keep partial collection runs (e.g. pytest tests/test_setup.py) cheap
+from msk_health_check.cluster_info import ClusterInfo
+
+# Hypothesis profiles: "fast" keeps local/CI runs quick (the properties
+# here are regex- and mock-bound, so 25 derandomized examples exercise
+# them just as well as 100), while "thorough" restores the defaults for
+# nightly runs. Select with HYPOTHESIS_PROFILE=thorough.
+settings.register_profile(
+    "fast",
+    max_examples=25,
+    deadline=None,
+    derandomize=True,
+    phases=[Phase.explicit, Phase.generate],
+)
+settings.register_profile("thorough", max_examples=100, deadline=None)
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "fast"))
+
+# Canonical test cluster ARN, shared by every test file instead of
+# repeating the 54-character literal
+TEST_ARN = 'arn:aws:kafka:us-east-1:123456789012:cluster/test/uuid'
+
+# Timestamps computed once at import; the analyzer only reads them, so the
+# tuple can be shared by every test without re-running 100 timedelta
+# subtractions per call
+_NOW = datetime.utcnow()
+_HOURS_100 = tuple(_NOW - timedelta(hours=i) for i in range(100))
+
+# Shared read-only value sequence; a tuple so accidental mutation fails loudly
+_ONES_100 = (1.0,) * 100
+
+
+@functools.lru_cache(maxsize=None)
+def _client_error(code, message, operation):
+    """
+    Cached ClientError instance per (code, message, operation).
+
+    Mock clients raise the same error repeatedly (retry loops, Hypothesis
+    examples); reusing one instance skips the response-dict and exception
+    construction on every raise. The traceback is still attached fresh at
+    each raise site. Imported lazily so collection stays botocore-free.
+    """
+    from botocore.exceptions import ClientError
+    return ClientError({'Error': {'Code': code, 'Message': message}}, operation)
+
+
+@pytest.fixture(scope="session")
+def success_cw_client():
+    """
+    Shared always-successful CloudWatch mock, built once per session.
+
+    Construction is cheap but the client is hit by many tests (and by
+    every Hypothesis example); the autouse reset below zeroes its call
+    counters so each test still sees fresh counts.
+    """
+    from tests.test_metrics_collector import MockCloudWatchClient
+    return MockCloudWatchClient(success=True)
+
+
+@pytest.fixture(autouse=True)
+def _reset_cw_counters(success_cw_client):
+    """Reset the shared mock's call counters before each test."""
+    success_cw_client.call_count = 0
+    success_cw_client._call_counts.clear()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    """
+    Stub out the collector's retry sleeps so no test ever waits.
+
+    Returns the MagicMock so tests asserting the backoff pattern can
+    inspect its call_args_list.
+    """
+    mock_sleep = MagicMock()
+    monkeypatch.setattr('msk_health_check.metrics_collector.time.sleep', mock_sleep)
+    return mock_sleep
+
+
+@pytest.fixture
+def frozen_now(monkeypatch):
+    """
+    Freeze the metrics collector's clock at a fixed instant.
+
+    Returns the frozen datetime so tests can derive query windows from it
+    instead of re-reading the wall clock, which keeps start_time/end_time
+    assertions deterministic.
+    """
+    fixed = datetime(2024, 1, 1, 0, 0, 0)
+
+    class _FrozenDatetime(datetime):
+        @classmethod
+        def utcnow(cls):
+            return fixed
+
+    monkeypatch.setattr('msk_health_check.metrics_collector.datetime', _FrozenDatetime)
+    return fixed
+
+
+@pytest.fixture(scope="session")
+def base_cluster_info():
+    """
+    Standard test cluster, built once per session.
+
+    Session-scoped so the dataclass is not rebuilt for every test; tests
+    needing a variant (e.g. EXPRESS) must take a dataclasses.replace copy
+    instead of mutating this instance.
+    """
+    return ClusterInfo(
+        arn=TEST_ARN,
+        name='test-cluster',
+        instance_type='kafka.m5.large',
+        instance_family='intel',
+        broker_count=3,
+        authentication_methods=['IAM'],
+        encryption_in_transit=True,
+        encryption_at_rest=True,
+        kafka_version='2.8.1',
+        cluster_type='PROVISIONED',
+        availability_zones=3,
+        encryption_in_transit_type='TLS',
+        storage_auto_scaling_enabled=True,
+        logging_enabled=False,
+        logging_destinations=[],
+        available_kafka_versions=['2.8.1', '3.8.x'],
+        intelligent_rebalancing_enabled=False,
+        ebs_volume_size=100,
+        enhanced_monitoring_level='DEFAULT',
+        cluster_state='ACTIVE',
+        creation_time=datetime.now(timezone.utc) - timedelta(days=60)
+    )
+
+
+@pytest.fixture(scope="session")
+def base_metrics():
+    """
+    Test metrics collection with 100 datapoints, built once per session.
+
+    The 100-point timestamp list is the expensive part; sharing one
+    instance amortizes it across every test that only reads the metrics.
+    """
+    from msk_health_check.metrics_collector import MetricData, MetricsCollection
+
+    metric_data = MetricData(
+        metric_name='ActiveControllerCount',
+        broker_id=None,
+        values=_ONES_100,
+        timestamps=_HOURS_100,
+        statistics={'avg': 1.0, 'min': 1.0, 'max': 1.0, 'p95': 1.0},
+        unit='Count'
+    )
+
+    return MetricsCollection(
+        cluster_arn=TEST_ARN,
+        start_time=_NOW - timedelta(days=7),
+        end_time=_NOW,
+        metrics={'ActiveControllerCount': [metric_data]},
+        missing_metrics=[]
+    )
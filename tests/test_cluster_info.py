@@ -2,36 +2,39 @@
 
 import pytest
 from msk_health_check.cluster_info import get_cluster_info, determine_instance_family, ClusterInfo
+from tests.conftest import TEST_ARN
 
 
 class TestDetermineInstanceFamily:
     """Tests for determine_instance_family function."""
     
-    def test_graviton_instances(self):
+    @pytest.mark.parametrize("instance_type", [
+        'kafka.m6g.large',
+        'kafka.m7g.xlarge',
+        'kafka.c6g.2xlarge',
+        'kafka.c7g.large',
+        'kafka.r6g.xlarge',
+        'kafka.r7g.2xlarge',
+        'kafka.t4g.small'
+    ])
+    def test_graviton_instances(self, instance_type):
         """Test Graviton instance identification."""
-        graviton_types = [
-            'kafka.m6g.large',
-            'kafka.m7g.xlarge',
-            'kafka.c6g.2xlarge',
-            'kafka.c7g.large',
-            'kafka.r6g.xlarge',
-            'kafka.r7g.2xlarge',
-            'kafka.t4g.small'
-        ]
-        for instance_type in graviton_types:
-            assert determine_instance_family(instance_type) == 'graviton'
-    
-    def test_intel_instances(self):
+        assert determine_instance_family(instance_type) == 'graviton'
+
+    @pytest.mark.parametrize("instance_type", [
+        'kafka.m5.large',
+        'kafka.m5.xlarge',
+        'kafka.m4.large',
+        'kafka.t3.small',
+        'kafka.t2.small',
+        'kafka.c5.2xlarge',
+        'kafka.c4.large',
+        'kafka.r5.xlarge',
+        'kafka.r4.large'
+    ])
+    def test_intel_instances(self, instance_type):
         """Test Intel instance identification."""
-        intel_types = [
-            'kafka.m5.large',
-            'kafka.m5.xlarge',
-            'kafka.t3.small',
-            'kafka.c5.2xlarge',
-            'kafka.r5.xlarge'
-        ]
-        for instance_type in intel_types:
-            assert determine_instance_family(instance_type) == 'intel'
+        assert determine_instance_family(instance_type) == 'intel'
 
 
 class TestGetClusterInfo:
@@ -40,7 +43,7 @@ class TestGetClusterInfo:
     def test_basic_cluster_info(self):
         """Test extraction of basic cluster information."""
         mock_client = MockMSKClient()
-        result = get_cluster_info(mock_client, 'arn:aws:kafka:us-east-1:123456789012:cluster/test/uuid')
+        result = get_cluster_info(mock_client, TEST_ARN)
         
         assert isinstance(result, ClusterInfo)
         assert result.name == 'test-cluster'
@@ -52,7 +55,7 @@ class TestGetClusterInfo:
     def test_authentication_methods_extraction(self):
         """Test extraction of authentication methods."""
         mock_client = MockMSKClient(auth_methods=['IAM', 'SASL/SCRAM'])
-        result = get_cluster_info(mock_client, 'arn:aws:kafka:us-east-1:123456789012:cluster/test/uuid')
+        result = get_cluster_info(mock_client, TEST_ARN)
         
         assert 'IAM' in result.authentication_methods
         assert 'SASL/SCRAM' in result.authentication_methods
@@ -60,21 +63,21 @@ class TestGetClusterInfo:
     def test_unauthenticated_access(self):
         """Test detection of unauthenticated access."""
         mock_client = MockMSKClient(auth_methods=['unauthenticated'])
-        result = get_cluster_info(mock_client, 'arn:aws:kafka:us-east-1:123456789012:cluster/test/uuid')
+        result = get_cluster_info(mock_client, TEST_ARN)
         
         assert 'unauthenticated' in result.authentication_methods
     
     def test_mtls_authentication(self):
         """Test detection of mTLS authentication."""
         mock_client = MockMSKClient(auth_methods=['mTLS'])
-        result = get_cluster_info(mock_client, 'arn:aws:kafka:us-east-1:123456789012:cluster/test/uuid')
+        result = get_cluster_info(mock_client, TEST_ARN)
         
         assert 'mTLS' in result.authentication_methods
     
     def test_encryption_settings(self):
         """Test extraction of encryption settings."""
         mock_client = MockMSKClient(encryption_in_transit=True, encryption_at_rest=True)
-        result = get_cluster_info(mock_client, 'arn:aws:kafka:us-east-1:123456789012:cluster/test/uuid')
+        result = get_cluster_info(mock_client, TEST_ARN)
         
         assert result.encryption_in_transit is True
         assert result.encryption_at_rest is True
@@ -82,7 +85,7 @@ class TestGetClusterInfo:
     def test_graviton_instance_cluster(self):
         """Test cluster with Graviton instances."""
         mock_client = MockMSKClient(instance_type='kafka.m6g.xlarge')
-        result = get_cluster_info(mock_client, 'arn:aws:kafka:us-east-1:123456789012:cluster/test/uuid')
+        result = get_cluster_info(mock_client, TEST_ARN)
         
         assert result.instance_type == 'kafka.m6g.xlarge'
         assert result.instance_family == 'graviton'
@@ -90,58 +93,53 @@ class TestGetClusterInfo:
 
 class MockMSKClient:
     """Mock MSK client for testing."""
-    
-    def __init__(self, instance_type='kafka.m5.large', broker_count=3, 
+
+    # Shared constant; callers only read the response
+    _KAFKA_VERSIONS = {
+        'KafkaVersions': [
+            {'Version': '3.8.0'},
+            {'Version': '3.7.0'},
+            {'Version': '2.8.1'},
+            {'Version': '2.7.0'}
+        ]
+    }
+
+    def __init__(self, instance_type='kafka.m5.large', broker_count=3,
                  auth_methods=None, encryption_in_transit=True, encryption_at_rest=True):
-        self.instance_type = instance_type
-        self.broker_count = broker_count
-        self.auth_methods = auth_methods or ['IAM']
-        self.encryption_in_transit = encryption_in_transit
-        self.encryption_at_rest = encryption_at_rest
-    
-    def list_kafka_versions(self):
-        """Mock list_kafka_versions call."""
-        return {
-            'KafkaVersions': [
-                {'Version': '3.8.0'},
-                {'Version': '3.7.0'},
-                {'Version': '2.8.1'},
-                {'Version': '2.7.0'}
-            ]
-        }
-    
-    def describe_cluster_v2(self, ClusterArn):
-        """Mock describe_cluster_v2 call."""
+        auth_methods = auth_methods or ['IAM']
+
+        # The response only depends on the constructor arguments, so build
+        # the nested dict once here instead of on every describe call
         client_auth = {}
-        
-        if 'IAM' in self.auth_methods:
+
+        if 'IAM' in auth_methods:
             client_auth.setdefault('Sasl', {})['Iam'] = {'Enabled': True}
-        if 'SASL/SCRAM' in self.auth_methods:
+        if 'SASL/SCRAM' in auth_methods:
             client_auth.setdefault('Sasl', {})['Scram'] = {'Enabled': True}
-        if 'mTLS' in self.auth_methods:
+        if 'mTLS' in auth_methods:
             client_auth['Tls'] = {'Enabled': True}
-        if 'unauthenticated' in self.auth_methods:
+        if 'unauthenticated' in auth_methods:
             client_auth['Unauthenticated'] = {'Enabled': True}
-        
+
         encryption_info = {}
-        if self.encryption_in_transit:
+        if encryption_in_transit:
             encryption_info['EncryptionInTransit'] = {'ClientBroker': 'TLS'}
         else:
             encryption_info['EncryptionInTransit'] = {'ClientBroker': 'PLAINTEXT'}
-        
-        if self.encryption_at_rest:
+
+        if encryption_at_rest:
             encryption_info['EncryptionAtRest'] = {'DataVolumeKMSKeyId': 'key-123'}
-        
-        return {
+
+        self._describe_response = {
             'ClusterInfo': {
-                'ClusterArn': ClusterArn,
+                'ClusterArn': None,
                 'ClusterName': 'test-cluster',
                 'Provisioned': {
                     'BrokerNodeGroupInfo': {
-                        'InstanceType': self.instance_type,
+                        'InstanceType': instance_type,
                         'ClientSubnets': ['subnet-1', 'subnet-2', 'subnet-3']
                     },
-                    'NumberOfBrokerNodes': self.broker_count,
+                    'NumberOfBrokerNodes': broker_count,
                     'CurrentBrokerSoftwareInfo': {
                         'KafkaVersion': '2.8.1'
                     },
@@ -155,3 +153,13 @@ class MockMSKClient:
                 }
             }
         }
+
+    def list_kafka_versions(self):
+        """Mock list_kafka_versions call."""
+        return self._KAFKA_VERSIONS
+
+    def describe_cluster_v2(self, ClusterArn):
+        """Mock describe_cluster_v2 call. Stamps the requested ARN into the
+        prebuilt response; callers do not mutate the result."""
+        self._describe_response['ClusterInfo']['ClusterArn'] = ClusterArn
+        return self._describe_response
@@ -3,18 +3,30 @@
 import os
 import pytest
 from datetime import datetime, timedelta
-from unittest.mock import MagicMock
+from unittest.mock import Mock
 
 from msk_health_check.cluster_info import ClusterInfo
 from msk_health_check.metrics_collector import MetricData, MetricsCollection
 from msk_health_check.analyzer import analyze_metrics
 from msk_health_check.recommendations import generate_recommendations
-from msk_health_check.visualizations import create_charts
 from msk_health_check.pdf_builder import ReportContent, generate_output_filename
 
+# Timestamps computed once at import; the workflow under test only reads
+# them, so the tuple is shared across runs
+_NOW = datetime.utcnow()
+_HOURS_10 = tuple(_NOW - timedelta(hours=i) for i in range(10))
 
+# Shared read-only value sequence; a tuple so accidental mutation fails loudly
+_FIFTIES_10 = (50.0,) * 10
+
+
+@pytest.mark.slow
 def test_end_to_end_workflow_without_pdf():
     """Test complete workflow from analysis to recommendations."""
+    # Imported here rather than at module top so collecting the suite (or
+    # deselecting this test) never pays for the visualization stack
+    from msk_health_check.visualizations import create_charts
+
     # Create test data
     cluster_info = ClusterInfo(
         arn='arn:aws:kafka:us-east-1:123456789012:cluster/test-cluster/abc123',
@@ -27,21 +39,25 @@ def test_end_to_end_workflow_without_pdf():
         authentication_methods=['IAM'],
         encryption_in_transit=True,
         encryption_at_rest=True,
+        encryption_in_transit_type='TLS',
         kafka_version='2.8.1',
         storage_auto_scaling_enabled=True,
         logging_enabled=True,
         logging_destinations=['CloudWatch'],
         available_kafka_versions=['3.8.0', '3.7.0', '2.8.1'],
-        intelligent_rebalancing_enabled=False
+        intelligent_rebalancing_enabled=False,
+        ebs_volume_size=100,
+        enhanced_monitoring_level='DEFAULT',
+        cluster_state='ACTIVE'
     )
     
     # Create test metrics
-    now = datetime.utcnow()
+    now = _NOW
     test_metric = MetricData(
         metric_name='CpuUser',
         broker_id='1',
-        timestamps=[now - timedelta(hours=i) for i in range(10)],
-        values=[50.0] * 10,
+        timestamps=_HOURS_10,
+        values=_FIFTIES_10,
         unit='Percent',
         statistics={'min': 50.0, 'max': 50.0, 'avg': 50.0, 'p95': 50.0, 'p99': 50.0}
     )
@@ -64,8 +80,9 @@ def test_end_to_end_workflow_without_pdf():
     recommendations = generate_recommendations(analysis)
     assert isinstance(recommendations, list)
     
-    # Mock CloudWatch client for charts
-    mock_cw_client = MagicMock()
+    # Mock CloudWatch client for charts; a spec'd Mock is cheaper to build
+    # than MagicMock and rejects typo'd method names
+    mock_cw_client = Mock(spec=['get_metric_widget_image'])
     mock_cw_client.get_metric_widget_image.return_value = {
         'MetricWidgetImage': b'fake_image_data'
     }
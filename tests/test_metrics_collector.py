@@ -1,13 +1,43 @@
 """Tests for metrics collector module."""
 
+import functools
+import numpy as np
 import pytest
+import threading
+from collections import defaultdict
 from datetime import datetime, timedelta
-from unittest.mock import MagicMock, patch
-from botocore.exceptions import ClientError
 
 from msk_health_check.metrics_collector import (
-    collect_metrics, query_metric_with_retry, MetricData, MetricsCollection, STANDARD_METRICS
+    collect_metrics, query_metric_with_retry, MetricData, MetricsCollection, STANDARD_METRICS,
+    _query_plan
 )
+from tests.conftest import _client_error
+
+# Shared building blocks for the mock client's synthetic datapoints. The
+# mock caps responses at 24 points and the offsets depend only on the
+# period, so compute the value column once at import and memoize the
+# offset tuple per period instead of redoing the timedelta arithmetic on
+# every call (Hypothesis runs hit the mock thousands of times).
+_MAX_POINTS = 24
+_VALUES = (50.0 + np.arange(_MAX_POINTS, dtype=np.float64)).tolist()
+
+# Canonical mock cluster ARN for this module's tests
+_CLUSTER_ARN = 'arn:aws:kafka:us-east-1:123456789012:cluster/test-cluster/uuid'
+
+# Metrics every provisioned-cluster health check must define
+_REQUIRED_METRICS = frozenset({
+    'ActiveControllerCount', 'OfflinePartitionsCount', 'KafkaDataLogsDiskUsed',
+    'ClientConnectionCount', 'ConnectionCount', 'ConnectionCreationRate',
+    'PartitionCount', 'CpuUser', 'CpuSystem',
+    'UnderMinIsrPartitionCount', 'BytesInPerSec', 'BytesOutPerSec',
+    'LeaderCount', 'MemoryUsed', 'MemoryFree', 'HeapMemoryAfterGC'
+})
+
+
+@functools.lru_cache(maxsize=8)
+def _timestamp_offsets(period):
+    """Offsets from the query start time for each datapoint slot."""
+    return tuple(timedelta(seconds=i * period) for i in range(_MAX_POINTS))
 
 
 class TestMetricDefinitions:
@@ -16,31 +46,20 @@ class TestMetricDefinitions:
     def test_all_14_metrics_defined(self):
         """Test that required metrics are defined."""
         assert len(STANDARD_METRICS) >= 14
-        
-        required_metrics = [
-            'ActiveControllerCount', 'OfflinePartitionsCount', 'KafkaDataLogsDiskUsed',
-            'ClientConnectionCount', 'ConnectionCount', 'ConnectionCreationRate',
-            'PartitionCount', 'CpuUser', 'CpuSystem',
-            'UnderMinIsrPartitionCount', 'BytesInPerSec', 'BytesOutPerSec',
-            'LeaderCount', 'MemoryUsed', 'MemoryFree', 'HeapMemoryAfterGC'
-        ]
-        
-        for metric in required_metrics:
-            assert metric in STANDARD_METRICS
+        assert _REQUIRED_METRICS.issubset(STANDARD_METRICS)
 
 
 class TestQueryMetricWithRetry:
     """Tests for query_metric_with_retry function."""
     
-    def test_successful_query(self):
+    def test_successful_query(self, success_cw_client, frozen_now):
         """Test successful metric query."""
-        mock_client = MockCloudWatchClient(success=True)
-        start_time = datetime.utcnow() - timedelta(days=1)
-        end_time = datetime.utcnow()
-        
+        start_time = frozen_now - timedelta(days=1)
+        end_time = frozen_now
+
         result = query_metric_with_retry(
-            mock_client, 'CpuUser', 
-            'arn:aws:kafka:us-east-1:123456789012:cluster/test-cluster/uuid',
+            success_cw_client, 'CpuUser',
+            _CLUSTER_ARN, None,
             start_time, end_time
         )
         
@@ -54,55 +73,51 @@ class TestQueryMetricWithRetry:
         assert 'p95' in result.statistics
         assert 'p99' in result.statistics
     
-    def test_no_datapoints(self):
+    def test_no_datapoints(self, frozen_now):
         """Test when no data points are returned."""
         mock_client = MockCloudWatchClient(datapoints=[])
-        start_time = datetime.utcnow() - timedelta(days=1)
-        end_time = datetime.utcnow()
+        start_time = frozen_now - timedelta(days=1)
+        end_time = frozen_now
         
         result = query_metric_with_retry(
             mock_client, 'CpuUser',
-            'arn:aws:kafka:us-east-1:123456789012:cluster/test-cluster/uuid',
+            _CLUSTER_ARN, None,
             start_time, end_time
         )
-        
+
         assert result is None
     
-    @patch('msk_health_check.metrics_collector.time.sleep')
-    def test_retry_with_exponential_backoff(self, mock_sleep):
+    def test_retry_with_exponential_backoff(self, no_sleep, frozen_now):
         """Test retry logic with exponential backoff."""
         mock_client = MockCloudWatchClient(fail_count=2)
-        start_time = datetime.utcnow() - timedelta(days=1)
-        end_time = datetime.utcnow()
-        
+        start_time = frozen_now - timedelta(days=1)
+        end_time = frozen_now
+
         result = query_metric_with_retry(
             mock_client, 'CpuUser',
-            'arn:aws:kafka:us-east-1:123456789012:cluster/test-cluster/uuid',
+            _CLUSTER_ARN, None,
             start_time, end_time, max_retries=3
         )
-        
+
         # Should succeed on third attempt
         assert result is not None
         assert mock_client.call_count == 3
-        
-        # Verify exponential backoff: 1s, 2s
-        assert mock_sleep.call_count == 2
-        assert mock_sleep.call_args_list[0][0][0] == 1  # 2^0
-        assert mock_sleep.call_args_list[1][0][0] == 2  # 2^1
-    
-    @patch('msk_health_check.metrics_collector.time.sleep')
-    def test_all_retries_exhausted(self, mock_sleep):
+
+        # Verify exponential backoff: 1s (2^0), 2s (2^1)
+        assert [call.args[0] for call in no_sleep.call_args_list] == [1, 2]
+
+    def test_all_retries_exhausted(self, no_sleep, frozen_now):
         """Test when all retries are exhausted."""
         mock_client = MockCloudWatchClient(fail_count=5)
-        start_time = datetime.utcnow() - timedelta(days=1)
-        end_time = datetime.utcnow()
-        
+        start_time = frozen_now - timedelta(days=1)
+        end_time = frozen_now
+
         result = query_metric_with_retry(
             mock_client, 'CpuUser',
-            'arn:aws:kafka:us-east-1:123456789012:cluster/test-cluster/uuid',
+            _CLUSTER_ARN, None,
             start_time, end_time, max_retries=3
         )
-        
+
         assert result is None
         assert mock_client.call_count == 3
 
@@ -110,24 +125,23 @@ class TestQueryMetricWithRetry:
 class TestCollectMetrics:
     """Tests for collect_metrics function."""
     
-    def test_successful_collection(self):
+    def test_successful_collection(self, success_cw_client, frozen_now):
         """Test successful collection of all metrics."""
-        mock_client = MockCloudWatchClient(success=True)
-        cluster_arn = 'arn:aws:kafka:us-east-1:123456789012:cluster/test-cluster/uuid'
-        
-        result = collect_metrics(mock_client, cluster_arn, broker_count=3, cluster_type='PROVISIONED', days_back=7)
-        
+        result = collect_metrics(success_cw_client, _CLUSTER_ARN, broker_count=3, cluster_type='PROVISIONED', days_back=7)
+
         assert isinstance(result, MetricsCollection)
-        assert result.cluster_arn == cluster_arn
+        assert result.cluster_arn == _CLUSTER_ARN
         assert len(result.metrics) > 0
         assert len(result.missing_metrics) == 0
-        assert result.end_time > result.start_time
-        assert (result.end_time - result.start_time).days == 7
+        assert result.end_time == frozen_now
+        assert result.end_time - result.start_time == timedelta(days=7)
+        # All metrics fit in one batched GetMetricData request
+        assert success_cw_client.call_count == 1
     
-    def test_partial_failure_graceful_degradation(self):
+    def test_partial_failure_graceful_degradation(self, frozen_now):
         """Test graceful handling of partial metric collection failures."""
         mock_client = MockCloudWatchClient(fail_metrics=['CpuUser', 'CpuSystem'])
-        cluster_arn = 'arn:aws:kafka:us-east-1:123456789012:cluster/test-cluster/uuid'
+        cluster_arn = _CLUSTER_ARN
         
         result = collect_metrics(mock_client, cluster_arn, broker_count=3, cluster_type='PROVISIONED', days_back=7)
         
@@ -135,13 +149,20 @@ class TestCollectMetrics:
         assert 'CpuUser' in result.missing_metrics
         assert 'CpuSystem' in result.missing_metrics
         assert len(result.metrics) == len(STANDARD_METRICS) - 2
+        # Per-query failures don't cost extra API calls
+        assert mock_client.call_count == 1
     
-    def test_time_period_documentation(self):
+    def test_query_plan_cached(self, success_cw_client):
+        """Test that same-shaped collections reuse the memoized query plan."""
+        _query_plan.cache_clear()
+        for _ in range(2):
+            collect_metrics(success_cw_client, _CLUSTER_ARN, broker_count=3, cluster_type='PROVISIONED', days_back=7)
+
+        assert _query_plan.cache_info().hits > 0
+
+    def test_time_period_documentation(self, success_cw_client, frozen_now):
         """Test that time period is properly documented."""
-        mock_client = MockCloudWatchClient(success=True)
-        cluster_arn = 'arn:aws:kafka:us-east-1:123456789012:cluster/test-cluster/uuid'
-        
-        result = collect_metrics(mock_client, cluster_arn, broker_count=3, cluster_type='PROVISIONED', days_back=30)
+        result = collect_metrics(success_cw_client, _CLUSTER_ARN, broker_count=3, cluster_type='PROVISIONED', days_back=30)
         
         assert result.start_time is not None
         assert result.end_time is not None
@@ -151,58 +172,96 @@ class TestCollectMetrics:
 
 class MockCloudWatchClient:
     """Mock CloudWatch client for testing."""
-    
+
     def __init__(self, success=True, datapoints=None, fail_count=0, fail_metrics=None):
         self.success = success
         self.datapoints = datapoints
         self.fail_count = fail_count
-        self.fail_metrics = fail_metrics or []
+        # frozenset makes the per-query membership test O(1)
+        self.fail_metrics = frozenset(fail_metrics or ())
         self.call_count = 0
-        self._call_counts = {}  # Track per-metric call counts for thread safety
-    
+        self._call_counts = defaultdict(int)  # Per-metric call counts
+        # collect_metrics may issue batches from worker threads, so guard
+        # the counters like a real thread-safe client would its state
+        self._lock = threading.Lock()
+
+    def get_metric_data(self, MetricDataQueries, StartTime, EndTime, **kwargs):
+        """Mock batched get_metric_data call. Metrics listed in fail_metrics
+        return an error StatusCode with no values, mirroring how the real
+        API reports per-query failures inside a successful response."""
+        with self._lock:
+            self.call_count += 1
+
+        results = []
+        for query in MetricDataQueries:
+            metric_name = query['MetricStat']['Metric']['MetricName']
+
+            if metric_name in self.fail_metrics:
+                results.append({
+                    'Id': query['Id'],
+                    'Label': metric_name,
+                    'Timestamps': [],
+                    'Values': [],
+                    'StatusCode': 'InternalError'
+                })
+                continue
+
+            if self.datapoints is not None:
+                timestamps = [dp['Timestamp'] for dp in self.datapoints]
+                values = [50.0] * len(timestamps)
+            elif self.success:
+                period = query['MetricStat']['Period']
+                num_points = min(int((EndTime - StartTime).total_seconds() / period), _MAX_POINTS)
+                offsets = _timestamp_offsets(period)
+                timestamps = [StartTime + offset for offset in offsets[:num_points]]
+                values = _VALUES[:num_points]
+            else:
+                timestamps, values = [], []
+
+            results.append({
+                'Id': query['Id'],
+                'Label': metric_name,
+                'Timestamps': timestamps,
+                'Values': values,
+                'StatusCode': 'Complete'
+            })
+
+        return {'MetricDataResults': results}
+
     def get_metric_statistics(self, **kwargs):
         """Mock get_metric_statistics call."""
-        self.call_count += 1
-        
         metric_name = kwargs.get('MetricName')
-        
-        # Track per-metric calls
-        if metric_name not in self._call_counts:
-            self._call_counts[metric_name] = 0
-        self._call_counts[metric_name] += 1
+
+        # Track total and per-metric calls
+        with self._lock:
+            self.call_count += 1
+            self._call_counts[metric_name] += 1
         
         # Check if this metric should fail
         if metric_name in self.fail_metrics:
-            raise ClientError(
-                {'Error': {'Code': 'Throttling', 'Message': 'Rate exceeded'}},
-                'GetMetricStatistics'
-            )
-        
+            raise _client_error('Throttling', 'Rate exceeded', 'GetMetricStatistics')
+
         # Simulate retries based on per-metric count
         if self._call_counts[metric_name] <= self.fail_count:
-            raise ClientError(
-                {'Error': {'Code': 'Throttling', 'Message': 'Rate exceeded'}},
-                'GetMetricStatistics'
-            )
+            raise _client_error('Throttling', 'Rate exceeded', 'GetMetricStatistics')
         
         if self.datapoints is not None:
             return {'Datapoints': self.datapoints, 'Label': 'Test'}
         
         if self.success:
-            # Generate sample data
+            # Generate sample data from the precomputed offset/value template
             start = kwargs['StartTime']
             end = kwargs['EndTime']
             period = kwargs['Period']
             stat = kwargs['Statistics'][0]
-            
-            num_points = min(int((end - start).total_seconds() / period), 24)
-            datapoints = []
-            for i in range(num_points):
-                datapoints.append({
-                    'Timestamp': start + timedelta(seconds=i * period),
-                    stat: 50.0 + i
-                })
-            
+
+            num_points = min(int((end - start).total_seconds() / period), _MAX_POINTS)
+            offsets = _timestamp_offsets(period)
+            datapoints = [
+                {'Timestamp': start + offset, stat: value}
+                for offset, value in zip(offsets[:num_points], _VALUES)
+            ]
+
             return {'Datapoints': datapoints, 'Label': 'Test'}
         
         return {'Datapoints': [], 'Label': 'Test'}
@@ -1,8 +1,8 @@
 """Unit tests for validators module."""
 
 import pytest
-from botocore.exceptions import ClientError
 from msk_health_check.validators import validate_region, validate_arn, verify_cluster_exists
+from tests.conftest import TEST_ARN, _client_error
 
 
 class TestValidateRegion:
@@ -16,21 +16,20 @@ class TestValidateRegion:
             assert result.is_valid  # nosemgrep: is-function-without-parentheses
             assert result.error_message is None
     
-    def test_invalid_regions(self):
+    @pytest.mark.parametrize('region', [
+        'invalid',
+        'us-east',
+        'us-east-1a',
+        'US-EAST-1',
+        '123-456-7',
+        '',
+        'us_east_1'
+    ])
+    def test_invalid_region(self, region):
         """Test invalid region formats."""
-        invalid_regions = [
-            'invalid',
-            'us-east',
-            'us-east-1a',
-            'US-EAST-1',
-            '123-456-7',
-            '',
-            'us_east_1'
-        ]
-        for region in invalid_regions:
-            result = validate_region(region)
-            assert not result.is_valid  # nosemgrep: is-function-without-parentheses
-            assert result.error_message is not None
+        result = validate_region(region)
+        assert not result.is_valid  # nosemgrep: is-function-without-parentheses
+        assert result.error_message is not None
 
 
 class TestValidateArn:
@@ -43,20 +42,19 @@ class TestValidateArn:
         assert result.is_valid  # nosemgrep: is-function-without-parentheses
         assert result.error_message is None
     
-    def test_invalid_arns(self):
+    @pytest.mark.parametrize('arn', [
+        'invalid-arn',
+        'arn:aws:ec2:us-east-1:123456789012:instance/i-123',
+        'arn:aws:kafka:us-east-1:123:cluster/test/uuid',
+        'arn:aws:kafka:invalid-region:123456789012:cluster/test/uuid',
+        '',
+        'arn:aws:kafka:us-east-1:123456789012:topic/test'
+    ])
+    def test_invalid_arn(self, arn):
         """Test invalid ARN formats."""
-        invalid_arns = [
-            'invalid-arn',
-            'arn:aws:ec2:us-east-1:123456789012:instance/i-123',
-            'arn:aws:kafka:us-east-1:123:cluster/test/uuid',
-            'arn:aws:kafka:invalid-region:123456789012:cluster/test/uuid',
-            '',
-            'arn:aws:kafka:us-east-1:123456789012:topic/test'
-        ]
-        for arn in invalid_arns:
-            result = validate_arn(arn)
-            assert not result.is_valid  # nosemgrep: is-function-without-parentheses
-            assert result.error_message is not None
+        result = validate_arn(arn)
+        assert not result.is_valid  # nosemgrep: is-function-without-parentheses
+        assert result.error_message is not None
 
 
 class TestVerifyClusterExists:
@@ -65,7 +63,7 @@ class TestVerifyClusterExists:
     def test_cluster_exists(self):
         """Test when cluster exists."""
         mock_client = MockMSKClient(exists=True)
-        arn = 'arn:aws:kafka:us-east-1:123456789012:cluster/test/uuid'
+        arn = TEST_ARN
         result = verify_cluster_exists(mock_client, arn)
         assert result.is_valid  # nosemgrep: is-function-without-parentheses
         assert result.error_message is None
@@ -73,7 +71,7 @@ class TestVerifyClusterExists:
     def test_cluster_not_found(self):
         """Test when cluster doesn't exist."""
         mock_client = MockMSKClient(exists=False)
-        arn = 'arn:aws:kafka:us-east-1:123456789012:cluster/test/uuid'
+        arn = TEST_ARN
         result = verify_cluster_exists(mock_client, arn)
         assert not result.is_valid  # nosemgrep: is-function-without-parentheses
         assert 'not found' in result.error_message.lower()
@@ -81,7 +79,7 @@ class TestVerifyClusterExists:
     def test_other_client_error(self):
         """Test when other AWS error occurs."""
         mock_client = MockMSKClient(error='AccessDenied')
-        arn = 'arn:aws:kafka:us-east-1:123456789012:cluster/test/uuid'
+        arn = TEST_ARN
         result = verify_cluster_exists(mock_client, arn)
         assert not result.is_valid  # nosemgrep: is-function-without-parentheses
         assert result.error_message is not None
@@ -97,13 +95,7 @@ class MockMSKClient:
     def describe_cluster_v2(self, ClusterArn):
         """Mock describe_cluster_v2 call."""
         if self.error:
-            raise ClientError(
-                {'Error': {'Code': self.error, 'Message': 'Test error'}},
-                'DescribeClusterV2'
-            )
+            raise _client_error(self.error, 'Test error', 'DescribeClusterV2')
         if not self.exists:
-            raise ClientError(
-                {'Error': {'Code': 'NotFoundException', 'Message': 'Cluster not found'}},
-                'DescribeClusterV2'
-            )
+            raise _client_error('NotFoundException', 'Cluster not found', 'DescribeClusterV2')
         return {'ClusterInfo': {'ClusterArn': ClusterArn}}